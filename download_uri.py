@@ -1,16 +1,24 @@
-import sys
+import argparse
 import pathlib
 import lbrytools as lbryt
-from lbrytools import download_single
+
+DOWNLOAD_DIR = str(pathlib.Path.home() / "Downloads")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python download_uri.py <URI>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Download LBRY claims by URI")
+    parser.add_argument("uris", metavar="URI", nargs="+")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="maximum number of simultaneous downloads (default: 8)",
+    )
+    args = parser.parse_args()
 
-    uri = sys.argv[1]
-    ddir = str(pathlib.Path.home() / "Downloads")
+    ddir = DOWNLOAD_DIR
     own_dir = True
 
-    d = lbryt.download_single(uri, ddir, own_dir)
-    print(d)
+    for uri, d in lbryt.download_many(
+        args.uris, threads=args.workers, ddir=ddir, own_dir=own_dir
+    ):
+        print(d)
@@ -6,18 +6,180 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QLineEdit,
+    QPlainTextEdit,
     QPushButton,
     QMessageBox,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+)
+from PyQt5.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
 )
 
+import collections
+import heapq
+import json
+import operator
+import os
 import pathlib
-import lbrytools as lbryt
-from lbrytools import download_single
+import threading
+import time
 
 P2P_DISCLAIMER = """LBRY is a peer-to-peer network. All content is contributed by users and LBRY does not censor or moderate the content of the network. Any conent you download or seed can be associated with your public IP address."""
 
+CACHE_DIR = pathlib.Path.home() / ".cache" / "lbryofalex"
+
+# Text of a row in the search results: "(amount) canonical_url"
+_ROW_FMT = "({:.2f}) {}".format
+
+lbryt = None
+
+
+def load_lbrytools():
+    """Import `lbrytools` on first use so the window appears without waiting."""
+    global lbryt
+    if lbryt is None:
+        import lbrytools
+
+        lbryt = lbrytools
+    return lbryt
+
+
+def write_json(path, data):
+    """Write `data` to `path` through a temporary file so it is never partial."""
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with open(tmp_path, "w") as fd:
+        json.dump(data, fd)
+    os.replace(tmp_path, path)
+
+
+class SearchCache:
+    """LRU cache of search results keyed by the normalized search text.
+
+    Entries expire after `ttl` seconds and the cache is saved to `path`
+    so that it survives restarts of the application. Changes are only
+    written when `save` is called, not on every `put`.
+    """
+
+    # Only the fields shown in the results list are kept,
+    # the full claims are too large to store on disk.
+    FIELDS = ("canonical_url", "amount")
+
+    def __init__(self, path, maxsize=256, ttl=300):
+        self.path = pathlib.Path(path)
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._dirty = False
+        self._load()
+
+    @staticmethod
+    def key(text):
+        return text.strip().lower()
+
+    def get(self, text):
+        key = self.key(text)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        timestamp, claims = entry
+        if time.time() - timestamp > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return claims
+
+    def put(self, text, claims):
+        claims = [
+            {field: claim[field] for field in self.FIELDS if field in claim}
+            for claim in claims
+        ]
+        key = self.key(text)
+        self._entries[key] = (time.time(), claims)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def clear(self):
+        self._entries.clear()
+        self._dirty = True
+        self.save()
+
+    def save(self):
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            write_json(self.path, list(self._entries.items()))
+        except OSError as err:
+            print(f"Cannot write search cache; {err}")
+
+    def _load(self):
+        try:
+            with open(self.path) as fd:
+                entries = json.load(fd)
+        except (OSError, ValueError):
+            return
+        # A file with another shape is ignored, and the cache starts empty
+        now = time.time()
+        try:
+            for key, (timestamp, claims) in entries:
+                if not isinstance(key, str) or not isinstance(claims, list):
+                    raise TypeError(f"bad entry for {key!r}")
+                if now - timestamp <= self.ttl:
+                    self._entries[key] = (timestamp, claims)
+        except (TypeError, ValueError) as err:
+            print(f"Ignoring search cache {self.path}; {err}")
+            self._entries.clear()
+
+
+class DownloadManifest:
+    """Record of the URIs already downloaded, saved to `path`.
+
+    The record is only trusted while the downloaded file still exists
+    in the same download directory.
+    """
+
+    def __init__(self, path):
+        self.path = pathlib.Path(path)
+        self._entries = None
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            try:
+                with open(self.path) as fd:
+                    self._entries = json.load(fd)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def get(self, uri, ddir):
+        entry = self.entries.get(uri)
+        if entry and entry["ddir"] == ddir and os.path.exists(entry["path"]):
+            return entry
+        return None
+
+    def add(self, uri, ddir, info):
+        self.entries[uri] = {
+            "path": info["download_path"],
+            "hash": info.get("sd_hash"),
+            "ddir": ddir,
+        }
+        try:
+            write_json(self.path, self.entries)
+        except OSError as err:
+            print(f"Cannot write download manifest; {err}")
+
 
 class LBRYOfAlexandria(QMainWindow):
     def __init__(self):
@@ -46,83 +208,291 @@ class LBRYOfAlexandria(QMainWindow):
         self.setWindowTitle("LBRY of Alexandria")
 
 
+class ClaimsModel(QAbstractListModel):
+    """List model over the `(amount, canonical_url)` rows of a search."""
+
+    URI_ROLE = Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        amount, canonical_url = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return _ROW_FMT(amount, canonical_url)
+        if role == self.URI_ROLE:
+            return canonical_url
+        return None
+
+    def setRows(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class SearchSignals(QObject):
+    finished = pyqtSignal(str, object)
+
+
+class SearchTask(QRunnable):
+    """Run `lbryt.list_search_claims` on a `QThreadPool` worker."""
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.signals = SearchSignals()
+
+    def run(self):
+        claims = None
+        try:
+            results = load_lbrytools().list_search_claims(text=self.text)
+            # It is False if there was a problem; then nothing is cached
+            if results:
+                claims = results.get("claims") or []
+        except Exception as err:
+            # An exception escaping a worker thread would abort the application
+            print(f"Search failed; {err}")
+        finally:
+            self.signals.finished.emit(self.text, claims)
+
+
 class SearchWidget(QWidget):
-    LIST_ITEM_URI_ROLE = 1
+    LIST_ITEM_URI_ROLE = ClaimsModel.URI_ROLE
+    MAX_RESULTS = 500
+    # Shorter texts are only searched with Enter or the Search button
+    MIN_LIVE_SEARCH = 3
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        self.search_cache = SearchCache(CACHE_DIR / "search.json")
+        self._searching = False
+        self._search_pending = False
         self.initUI()
 
     def initUI(self):
+        # Bursts of keystrokes, Enter presses, or clicks
+        # only trigger the last search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(300)
+        self._search_timer.timeout.connect(self._doSearch)
+
         self.edit_search = QLineEdit(self)
         self.edit_search.returnPressed.connect(self.searchClaims)
+        self.edit_search.textChanged.connect(self._onTextChanged)
 
-        btn_search = QPushButton("Search", self)
-        btn_search.clicked.connect(self.searchClaims)
+        # New results are written to disk a while after the last search,
+        # and when the application quits, not after every search
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(5000)
+        self._save_timer.timeout.connect(self.search_cache.save)
+        QApplication.instance().aboutToQuit.connect(self.search_cache.save)
 
-        self.list_widget = QListWidget(self)
+        self.btn_search = QPushButton("Search", self)
+        self.btn_search.clicked.connect(self.searchClaims)
+
+        # Cached results are reused for a few minutes; this forgets them
+        # when fresh results are wanted sooner
+        btn_clear_cache = QPushButton("Clear search cache", self)
+        btn_clear_cache.clicked.connect(self.search_cache.clear)
+
+        # Only the rows that are on screen are rendered by the view
+        self.claims_model = ClaimsModel(self)
+        self.list_view = QListView(self)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setModel(self.claims_model)
 
         # Set up the layout
         layout = QVBoxLayout()
         layout.addWidget(self.edit_search)
-        layout.addWidget(btn_search)
-        layout.addWidget(self.list_widget)
+        layout.addWidget(self.btn_search)
+        layout.addWidget(btn_clear_cache)
+        layout.addWidget(self.list_view)
         self.setLayout(layout)
 
     def searchClaims(self):
+        self._search_timer.start()
+
+    def _onTextChanged(self, text):
+        text = text.strip()
+        if not text or len(text) >= self.MIN_LIVE_SEARCH:
+            self._search_timer.start()
+        else:
+            self._search_timer.stop()
+
+    def _doSearch(self):
+        # Only one search runs at a time; the latest text is searched
+        # again when the running one finishes
+        if self._searching:
+            self._search_pending = True
+            return
+
         search_text = self.edit_search.text()
-        results = lbryt.list_search_claims(text=search_text)
-        self.list_widget.clear()
-        claims = results.get("claims", [{}])
-        claims.sort(key=lambda claim: float(claim.get("amount", "0")), reverse=True)
-        for claim in claims:
-            canonical_url = claim.get("canonical_url")
-            if canonical_url is None:
-                continue
-            item_text = canonical_url
-            list_item = QListWidgetItem(item_text)
-            list_item.setData(self.LIST_ITEM_URI_ROLE, claim["canonical_url"])
-            list_item.setFlags(list_item.flags() | 2)  # Make item selectable
-            self.list_widget.addItem(list_item)
+        if not search_text.strip():
+            self.claims_model.setRows([])
+            return
+
+        claims = self.search_cache.get(search_text)
+        if claims is not None:
+            self._showClaims(claims)
+            return
+
+        # The search blocks until the daemon answers, so it runs
+        # in the thread pool and reports back through a queued signal.
+        task = SearchTask(search_text)
+        task.signals.finished.connect(self._onSearchFinished)
+        self._searching = True
+        self.btn_search.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _onSearchFinished(self, search_text, claims):
+        self._searching = False
+        self.btn_search.setEnabled(True)
+        if claims is not None:
+            self.search_cache.put(search_text, claims)
+            self._save_timer.start()
+            self._showClaims(claims)
+        if self._search_pending:
+            self._search_pending = False
+            self._doSearch()
+
+    def _showClaims(self, claims):
+        # Parse every amount once, drop claims without a URL,
+        # and keep only the highest bids without sorting the whole list
+        rows = heapq.nlargest(
+            self.MAX_RESULTS,
+            (
+                (float(claim.get("amount", "0")), canonical_url)
+                for claim in claims
+                if (canonical_url := claim.get("canonical_url")) is not None
+            ),
+            key=operator.itemgetter(0),
+        )
+        self.claims_model.setRows(rows)
+
+
+class DownloadSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class DownloadTask(QRunnable):
+    """Run `lbryt.download_many` on a `QThreadPool` worker."""
+
+    def __init__(self, uris, ddir, own_dir=True, workers=8):
+        super().__init__()
+        self.uris = uris
+        self.ddir = ddir
+        self.own_dir = own_dir
+        self.workers = workers
+        self.signals = DownloadSignals()
+
+    def run(self):
+        results = []
+        try:
+            for uri, result in load_lbrytools().download_many(
+                self.uris, threads=self.workers, ddir=self.ddir, own_dir=self.own_dir
+            ):
+                results.append((uri, result))
+        except Exception as err:
+            # An exception escaping a worker thread would abort the application
+            print(f"Download failed; {err}")
+        finally:
+            # URIs without a result, for example when the server is down,
+            # are reported as failed
+            done = {uri for uri, _ in results}
+            results.extend((uri, False) for uri in self.uris if uri not in done)
+            self.signals.finished.emit(results)
 
 
 class DownloadWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.parent = parent
+        self._ddir = str(pathlib.Path.home() / "Documents" / "LBRYOfAlexandria")
+        pathlib.Path(self._ddir).mkdir(parents=True, exist_ok=True)
+        self.manifest = DownloadManifest(CACHE_DIR / "downloaded.json")
         self.initUI()
 
     def initUI(self):
-        label = QLabel("Download URI:", self)
+        label = QLabel("Download URIs (one per line):", self)
 
-        # Create a QLineEdit for URI input
-        self.edit_uri = QLineEdit(self)
+        # Create a QPlainTextEdit for URI input
+        self.edit_uri = QPlainTextEdit(self)
 
         # Create a button for download
-        btn_download = QPushButton("Download", self)
-        btn_download.clicked.connect(self.downloadURI)
+        self.btn_download = QPushButton("Download", self)
+        self.btn_download.clicked.connect(self.downloadURI)
 
         # Set up the layout
         layout = QVBoxLayout()
         layout.addWidget(label)
         layout.addWidget(self.edit_uri)
-        layout.addWidget(btn_download)
+        layout.addWidget(self.btn_download)
         self.setLayout(layout)
 
     def downloadURI(self):
-        uri = self.edit_uri.text()
-        ddir = str(pathlib.Path.home() / "Documents" / "LBRYOfAlexandria")
-        pathlib.Path(ddir).mkdir(parents=True, exist_ok=True)
+        uris = [
+            line.strip()
+            for line in self.edit_uri.toPlainText().split("\n")
+            if line.strip()
+        ]
+        if not uris:
+            return
+
+        # Skip the URIs whose files are still in the download directory
+        pending = []
+        downloaded = []
+        for uri in uris:
+            entry = self.manifest.get(uri, self._ddir)
+            if entry is None:
+                pending.append(uri)
+            else:
+                downloaded.append(entry["path"])
+        if downloaded:
+            QMessageBox.information(self, "Already downloaded", "\n".join(downloaded))
+        if not pending:
+            return
+
+        # The download blocks until all blobs are fetched, so it runs
+        # in the thread pool and reports back through a queued signal.
+        task = DownloadTask(pending, self._ddir, own_dir=True)
+        task.signals.finished.connect(self._onDownloadFinished)
+        self.btn_download.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _onDownloadFinished(self, results):
         # Includes: download_path, channel_name, channel_claim_id, claim_name, content_fee
         #          download_directory, download_path, metadata, title, streaming_url
-        result = lbryt.download_single(uri, ddir=ddir, own_dir=True)
-        print(result)
-        QMessageBox.information(self, f"Downloading to {ddir}", P2P_DISCLAIMER)
+        started = 0
+        failed = []
+        for uri, result in results:
+            print(result)
+            if isinstance(result, dict) and result.get("download_path"):
+                self.manifest.add(uri, self._ddir, result)
+                started += 1
+            else:
+                failed.append(uri)
+        self.btn_download.setEnabled(True)
+        if failed:
+            QMessageBox.warning(self, "Download failed", "\n".join(failed))
+        if started:
+            QMessageBox.information(self, f"Downloading to {self._ddir}", P2P_DISCLAIMER)
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Warm up the import while the window is shown
+    threading.Thread(target=load_lbrytools, daemon=True).start()
     lbry_app = LBRYOfAlexandria()
     lbry_app.show()
     sys.exit(app.exec_())
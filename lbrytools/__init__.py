@@ -91,6 +91,7 @@ from lbrytools.download_multi import ch_download_latest
 from lbrytools.download_multi import ch_download_latest_multi
 from lbrytools.download_multi import redownload_latest
 from lbrytools.download_multi import download_claims
+from lbrytools.download_multi import download_many
 
 from lbrytools.clean import delete_single
 
@@ -138,9 +139,11 @@ from lbrytools.support import get_all_supports
 from lbrytools.support import list_supports
 from lbrytools.support import get_base_support
 from lbrytools.support import create_support
+from lbrytools.support import add_support
 from lbrytools.support import abandon_support
 from lbrytools.support import abandon_support_inv
 from lbrytools.support import target_support
+from lbrytools.support import target_supports
 
 from lbrytools.blobs_ratio import print_blobs_ratio
 
@@ -193,6 +196,7 @@ True if ch_download_latest else False
 True if ch_download_latest_multi else False
 True if redownload_latest else False
 True if download_claims else False
+True if download_many else False
 
 True if delete_single else False
 
@@ -240,9 +244,11 @@ True if get_all_supports else False
 True if list_supports else False
 True if get_base_support else False
 True if create_support else False
+True if add_support else False
 True if abandon_support else False
 True if abandon_support_inv else False
 True if target_support else False
+True if target_supports else False
 
 True if print_blobs_ratio else False
 
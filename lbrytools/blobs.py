@@ -25,6 +25,7 @@
 # --------------------------------------------------------------------------- #
 """Functions to help use with blobs from LBRY content."""
 import concurrent.futures as fts
+import functools
 import json
 import os
 
@@ -434,17 +435,17 @@ def count_blobs_all(blobfiles=None, channel=None,
 
     # Iterables to be passed to the ThreadPoolExecutor
     results = []
-    cids = (claim["claim_id"] for claim in claims)
-    names = (claim["claim_name"] for claim in claims)
-    blobfs = (blobfiles for n in range(n_claims))
-    prt_msgs = (print_msg for n in range(n_claims))
-    servers = (server for n in range(n_claims))
+    cids = [claim["claim_id"] for claim in claims]
+    names = [claim["claim_name"] for claim in claims]
 
     if threads:
+        count = functools.partial(c_blobs_th,
+                                  blobfiles=blobfiles, print_msg=print_msg,
+                                  server=server)
+
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
             # The input must be iterables
-            results = executor.map(c_blobs_th,
-                                   cids, names, blobfs, prt_msgs, servers)
+            results = executor.map(count, cids, names)
             print("Waiting for blob count to finish; "
                   f"max threads: {threads}")
             results = list(results)  # generator to list
@@ -25,6 +25,7 @@
 # --------------------------------------------------------------------------- #
 """Functions to help use with blobs from LBRY content."""
 import concurrent.futures as fts
+import operator
 import os
 import time
 
@@ -750,7 +751,7 @@ def print_channel_analysis(blobfiles=None, split=True, bar=False,
         # Sort by the first element of the pair, the size
         sorted_list = sorted(pair.items(),
                              reverse=reverse,
-                             key=lambda item: item[0])
+                             key=operator.itemgetter(0))
 
         # Just take the second element, the line, into a new list
         line = []
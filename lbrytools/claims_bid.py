@@ -24,8 +24,6 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Functions to display claims that are competing in name and LBC bidding."""
-import requests
-
 import lbrytools.funcs as funcs
 
 
@@ -113,7 +111,8 @@ def claims_bids(show_controlling=False, show_non_controlling=True,
            "params": {"page_size": 99000,
                       "resolve": True}}
 
-    output = requests.post(server, json=msg).json()
+    output = funcs.post_json(server, msg,
+                             read_timeout=funcs.LONG_READ_TIMEOUT)
     if "error" in output:
         print(">>> No 'result' in the JSON-RPC server output")
         return False
@@ -189,7 +188,7 @@ def claims_bids(show_controlling=False, show_non_controlling=True,
                 "params": {"name": name,
                            "page_size": 1000}}
 
-        output2 = requests.post(server, json=msg2).json()
+        output2 = funcs.post_json(server, msg2)
         if "error" in output2:
             print(">>> No 'result' in the JSON-RPC server output")
             return False
@@ -186,8 +186,8 @@ def list_ch_claims(channel,
                                reverse=reverse,
                                file=file, fdate=fdate, sep=sep)
 
-    print(80 * "-")
-    print(claims_info["summary"])
+    # The list of claims is already written in one call by `print_content`
+    print("\n".join([80 * "-", claims_info["summary"]]))
 
     return claims_info
 
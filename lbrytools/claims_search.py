@@ -25,8 +25,7 @@
 # --------------------------------------------------------------------------- #
 """Functions to display information on our own claims."""
 import concurrent.futures as fts
-
-import requests
+import itertools
 
 import lbrytools.funcs as funcs
 import lbrytools.search_utils as sutils
@@ -101,8 +100,15 @@ def params_claim_search(msg=None,
 
 def claim_search_pg(msg, page, server):
     """Call the search claim method with the appropriate page in a thread."""
-    msg["params"].update({"page": page})
-    output = requests.post(server, json=msg).json()
+    # The same `msg` is shared by all threads, so each page uses a copy
+    msg = {"method": msg["method"],
+           "params": dict(msg["params"], page=page)}
+    output = funcs.post_json(server, msg)
+
+    if "error" in output:
+        print(f">>> Error: page {page}; {output['error']['message']}")
+        return []
+
     items = output["result"]["items"]
 
     return items
@@ -171,8 +177,8 @@ def w_claim_search(what="trending",
     else:
         searched.append("page: all")
         pages = range(1, 21)
-        msg_s = (msg for n in pages)
-        servers = (server for n in pages)
+        msg_s = itertools.repeat(msg)
+        servers = itertools.repeat(server)
 
     print()
 
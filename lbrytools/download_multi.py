@@ -24,6 +24,7 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Functions to help with downloading multiple claims from the LBRY network."""
+import concurrent.futures as fts
 import os
 import random
 
@@ -467,3 +468,95 @@ def download_claims(ddir=None, own_dir=True, save_file=True,
         print()
 
     return list_info_get
+
+
+def download_many(uris=None, threads=8,
+                  ddir=None, own_dir=True, save_file=True,
+                  server="http://localhost:5279"):
+    """Download a list of claims by URI using several threads.
+
+    Each claim is downloaded with `download_single` in its own thread,
+    so the downloads of independent streams overlap in time.
+    The results are yielded as soon as each download finishes,
+    so they don't necessarily come in the same order as `uris`.
+
+    Parameters
+    ----------
+    uris: list of str
+        Each element is a unified resource identifier (URI)
+        to a claim on the LBRY network. It can be full or partial.
+        ::
+            uris = ['lbry://@MyChannel#3/some-video-name#2',
+                    '@MyChannel#3/other-video#5',
+                    'some-video-name']
+    threads: int, optional
+        It defaults to 8.
+        It is the maximum number of threads that will be used
+        to download claims at the same time.
+        Each download is limited by the network, so this number
+        can be larger than the number of CPU cores.
+    ddir: str, optional
+        It defaults to `$HOME`.
+        The path to the download directory.
+    own_dir: bool, optional
+        It defaults to `True`, in which case it places the downloaded
+        content inside a subdirectory named after the channel in `ddir`.
+    save_file: bool, optional
+        It defaults to `True`, in which case all blobs of the stream
+        will be downloaded, and the media file (mp4, mp3, mkv, etc.)
+        will be placed in the downloaded directory.
+        If it is `False` it will only download the blobs.
+    server: str, optional
+        It defaults to `'http://localhost:5279'`.
+        This is the address of the `lbrynet` daemon, which should be running
+        in your computer before using any `lbrynet` command.
+        Normally, there is no need to change this parameter from its default
+        value.
+
+    Yields
+    ------
+    tuple of (str, dict)
+        For each URI, a tuple with the URI and the dictionary
+        that represents the standard output of the `lbrynet_get` command.
+        The dictionary is `False` if that claim could not be downloaded.
+    """
+    if not funcs.server_exists(server=server):
+        return
+
+    if not uris or not isinstance(uris, (list, tuple)):
+        print("Download claims from a list of URIs.")
+        print(f"uris={uris}")
+        return
+
+    if (not ddir or not isinstance(ddir, str)
+            or ddir == "~" or not os.path.exists(ddir)):
+        ddir = os.path.expanduser("~")
+        print(f"Download directory should exist; set to ddir='{ddir}'")
+
+    if not threads or not isinstance(threads, int) or threads < 1:
+        threads = 8
+        print("Threads must be a positive integer, "
+              f"set to default value, threads={threads}")
+
+    with fts.ThreadPoolExecutor(max_workers=threads) as executor:
+        futures = {executor.submit(dld.download_single,
+                                   uri=uri,
+                                   ddir=ddir, own_dir=own_dir,
+                                   save_file=save_file,
+                                   server=server): uri
+                   for uri in uris}
+
+        print("Waiting for downloads to finish; "
+              f"max threads: {threads}")
+
+        for future in fts.as_completed(futures):
+            uri = futures[future]
+
+            # A failed download must not lose the results of the others
+            try:
+                result = future.result()
+            except Exception as err:
+                print(f">>> Error: {uri}; {err}")
+                result = False
+
+            yield uri, result
@@ -24,11 +24,17 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Auxiliary functions for other methods of the lbrytools package."""
+import atexit
+import concurrent.futures as fts
+import functools
+import itertools
+import json
 import os
 import random
 import regex
 import requests
 import subprocess
+import threading
 import time
 
 try:
@@ -37,10 +43,159 @@ try:
 except ModuleNotFoundError:
     EMOJI_LOADED = False
 
+try:
+    import orjson
+    ORJSON_LOADED = True
+except ModuleNotFoundError:
+    ORJSON_LOADED = False
+
 TFMT = "%Y-%m-%d_%H:%M:%S%z %A"
 TFMTp = "%Y-%m-%d_%H:%M:%S%z"
 TFMTf = "%Y%m%d_%H%M"
 
+# A URI with an optional scheme; the first group is the rest of the URI,
+# that is, '@channel#id/name#id'
+URI_RE = regex.compile(r"(?:lbry://)?(.*)", regex.DOTALL)
+
+# Seconds to wait for a connection to the daemon, and for its answer.
+# Methods that return very long lists, such as `support_list`
+# or `file_list` with big pages, pass `LONG_READ_TIMEOUT` instead.
+CONNECT_TIMEOUT = 3
+READ_TIMEOUT = 60
+LONG_READ_TIMEOUT = 600
+
+# A single session keeps the connections to the `lbrynet` daemon alive
+# so that many requests, even from many threads, reuse a pool of sockets
+# instead of opening a new connection each time.
+# Only failed connections are retried; a request that reached the daemon
+# is never sent again, as it may have created a transaction.
+SESSION = requests.Session()
+SESSION.mount("http://",
+              requests.adapters.HTTPAdapter(
+                  pool_connections=64,
+                  pool_maxsize=64,
+                  max_retries=requests.adapters.Retry(total=3, connect=3,
+                                                      read=0, status=0,
+                                                      backoff_factor=0.1)))
+
+# Thread pool reused by all functions that send requests in parallel,
+# so the threads are not created and destroyed on every call.
+# It has a fixed size, the same as the connection pool of `SESSION`;
+# each call limits how many of its own tasks run at once,
+# see `run_limited`.
+POOL_THREADS = 64
+EXECUTOR = None
+EXECUTOR_LOCK = threading.Lock()
+
+# Time until which each server is known to be up, see `server_exists`
+SERVER_TTL = 30
+SERVER_OK_UNTIL = {}
+
+
+def get_executor():
+    """Return the shared thread pool, with `POOL_THREADS` threads.
+
+    The pool is created on first use, and is only shut down
+    when the program exits, so callers can always submit to it.
+    Tasks running in this pool must not wait for other tasks
+    submitted to the same pool, otherwise they may block forever.
+    """
+    global EXECUTOR
+
+    with EXECUTOR_LOCK:
+        if EXECUTOR is None:
+            EXECUTOR = fts.ThreadPoolExecutor(max_workers=POOL_THREADS,
+                                              thread_name_prefix="lbrytools")
+
+        return EXECUTOR
+
+
+def run_limited(func, items, threads=32):
+    """Run `func(item)` for each item in the shared thread pool.
+
+    At most `threads` of these calls are submitted at the same time,
+    so every caller keeps its own limit although the pool is shared.
+    It yields a pair `(num, result)` as soon as each call is done,
+    where `num` is the position of the item in `items`.
+    """
+    executor = get_executor()
+    items = enumerate(items)
+    pending = {executor.submit(func, item): num
+               for num, item in itertools.islice(items, max(threads, 1))}
+
+    while pending:
+        done, _ = fts.wait(pending, return_when=fts.FIRST_COMPLETED)
+
+        for future in done:
+            num = pending.pop(future)
+
+            # Keep the window full before handing out the result
+            for next_num, item in itertools.islice(items, 1):
+                pending[executor.submit(func, item)] = next_num
+
+            yield num, future.result()
+
+
+def shutdown_executor():
+    """Stop the threads of the shared thread pool."""
+    global EXECUTOR
+
+    with EXECUTOR_LOCK:
+        if EXECUTOR is not None:
+            EXECUTOR.shutdown()
+            EXECUTOR = None
+
+
+atexit.register(shutdown_executor)
+
+
+def json_dumps(msg):
+    """Encode a JSON-RPC message as bytes, with `orjson` if available."""
+    if ORJSON_LOADED:
+        return orjson.dumps(msg)
+    return json.dumps(msg).encode("utf-8")
+
+
+def json_loads(content):
+    """Decode the bytes of a JSON-RPC response, with `orjson` if available."""
+    if ORJSON_LOADED:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def post_raw(server, msg, read_timeout=None):
+    """Send a JSON-RPC message to the server and return the raw response.
+
+    It waits `read_timeout` seconds for the answer, by default
+    `READ_TIMEOUT`. If the request fails, it returns a response
+    with the `'error'` key, which every caller already checks.
+    """
+    if read_timeout is None:
+        read_timeout = READ_TIMEOUT
+
+    try:
+        response = SESSION.post(server, data=json_dumps(msg),
+                                headers={"Content-Type": "application/json"},
+                                timeout=(CONNECT_TIMEOUT, read_timeout))
+    except requests.exceptions.RequestException as err:
+        return json_dumps({"error": {"message": f"{msg['method']}: {err}"}})
+
+    return response.content
+
+
+def post_json(server, msg, read_timeout=None):
+    """Send a JSON-RPC message to the server and return the decoded output."""
+    return json_loads(post_raw(server, msg, read_timeout=read_timeout))
+
+
+@functools.lru_cache(maxsize=4096)
+def short_uri(uri):
+    """Return the URI without the 'lbry://' scheme.
+
+    The same channel URIs appear in many claims, so the result is memoized.
+    """
+    return URI_RE.match(uri).group(1)
+
 
 def start_lbry():
     """Launch the lbrynet client through subprocess."""
@@ -106,14 +261,25 @@ def check_lbry(server="http://localhost:5279"):
 
 
 def server_exists(server="http://localhost:5279"):
-    """Return True if the server is up, and False if not."""
+    """Return True if the server is up, and False if not.
+
+    A positive answer is remembered for `SERVER_TTL` seconds,
+    so functions that call each other, or that run for many claims,
+    don't ping the server every time.
+    """
+    if SERVER_OK_UNTIL.get(server, 0) > time.monotonic():
+        return True
+
     try:
-        requests.post(server)
+        SESSION.post(server, timeout=(CONNECT_TIMEOUT, None))
     except requests.exceptions.ConnectionError:
+        SERVER_OK_UNTIL.pop(server, None)
         print(f"Cannot establish connection to 'lbrynet' on {server}")
         print("Start server with:")
         print("  lbrynet start")
         return False
+
+    SERVER_OK_UNTIL[server] = time.monotonic() + SERVER_TTL
     return True
 
 
@@ -33,6 +33,7 @@ of a single claim, multiple claims, a channel, or multiple channels.
 Originally based on @miko:f/peer-lister:9
 """
 import concurrent.futures as fts
+import itertools
 import os
 import json
 import time
@@ -420,7 +421,7 @@ def search_m_claim_peers(claims=None, resolve=True, threads=32,
     streams_info = []
 
     # Iterables to be passed to the ThreadPoolExecutor
-    servers = (server for n in range(n_claims))
+    servers = itertools.repeat(server, n_claims)
 
     if threads:
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
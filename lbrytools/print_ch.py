@@ -26,6 +26,7 @@
 """Functions to print channels in the LBRY network."""
 import time
 import concurrent.futures as fts
+import functools
 
 import lbrytools.funcs as funcs
 import lbrytools.sort as sort
@@ -256,21 +257,16 @@ def print_channels(full=True, canonical=False,
     if invalid:
         offline = True
 
-    # Iterables to be passed to the ThreadPoolExecutor
     all_channels = []
-    n_items = len(items)
-    cids = (item["claim_id"] for item in items)
-    fulls = (full for n in range(n_items))
-    canonicals = (canonical for n in range(n_items))
-    offs = (offline for n in range(n_items))
-    servers = (server for n in range(n_items))
+    cids = [item["claim_id"] for item in items]
 
     if threads:
+        find_ch = functools.partial(find_ch_th,
+                                    full=full, canonical=canonical,
+                                    offline=offline, server=server)
+
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
-            # The input must be iterables
-            results = executor.map(find_ch_th,
-                                   cids, fulls, canonicals, offs,
-                                   servers)
+            results = executor.map(find_ch, cids)
 
             # generator to list, only non False items are added
             all_channels = [ch for ch in results if ch]
@@ -76,11 +76,11 @@ def get_fields(claim,
     if "signing_channel" in claim:
         if "canonical_url" in claim["signing_channel"]:
             channel = claim["signing_channel"]["canonical_url"]
-            channel = channel.split("lbry://")[1]
+            channel = funcs.short_uri(channel)
         elif "permanent_url" in claim["signing_channel"]:
             channel = claim["signing_channel"]["permanent_url"]
             _ch, _id = channel.split("#")
-            _ch = _ch.split("lbry://")[1]
+            _ch = funcs.short_uri(_ch)
             channel = _ch + "#" + _id[0:3]
         else:
             channel = 14 * "_"
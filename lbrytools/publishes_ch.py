@@ -25,6 +25,7 @@
 # --------------------------------------------------------------------------- #
 """Functions to get the list of published channels in the LBRY network."""
 import concurrent.futures as fts
+import itertools
 import time
 
 import requests
@@ -142,9 +143,9 @@ def get_channels(wallet_id="default_wallet",
 
     # Iterables to be passed to the ThreadPoolExecutor
     ch_addresses = (ch["address"] for ch in channels)
-    falses = (False for n in range(n_channels))
-    wallet_ids = (wallet_id for n in range(n_channels))
-    servers = (server for n in range(n_channels))
+    falses = itertools.repeat(False, n_channels)
+    wallet_ids = itertools.repeat(wallet_id, n_channels)
+    servers = itertools.repeat(server, n_channels)
 
     if threads:
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
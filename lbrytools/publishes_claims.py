@@ -78,9 +78,8 @@ def get_channel_claims(wallet_id="default_wallet",
                 else:
                     claim["value"]["release_time"] = claim["timestamp"]
 
-        claims = sorted(claims,
-                        key=lambda c: int(c["value"]["release_time"]),
-                        reverse=reverse)
+        claims.sort(key=lambda c: int(c["value"]["release_time"]),
+                    reverse=reverse)
 
         ds = sutils.downloadable_size(claims, local=False, print_msg=False)
 
@@ -138,9 +137,8 @@ def get_anon_claims(wallet_id="default_wallet",
     if not anon_claims:
         return False
 
-    anon_claims = sorted(anon_claims,
-                         key=lambda c: int(c["value"]["release_time"]),
-                         reverse=reverse)
+    anon_claims.sort(key=lambda c: int(c["value"]["release_time"]),
+                     reverse=reverse)
 
     anon_ds = sutils.downloadable_size(anon_claims, local=False,
                                        print_msg=False)
@@ -274,11 +272,11 @@ def print_s_claims(claims, output=None,
         if "signing_channel" in claim:
             if "canonical_url" in claim["signing_channel"]:
                 channel = claim["signing_channel"]["canonical_url"]
-                channel = channel.split("lbry://")[1]
+                channel = funcs.short_uri(channel)
             else:
                 channel = claim["signing_channel"]["permanent_url"]
                 _ch, _id = channel.split("#")
-                _ch = _ch.split("lbry://")[1]
+                _ch = funcs.short_uri(_ch)
                 channel = _ch + "#" + _id[0:3]
         else:
             channel = 14 * "_"
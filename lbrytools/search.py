@@ -24,14 +24,137 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Functions to help with searching claims in the LBRY network."""
-import concurrent.futures as fts
-
-import requests
+import asyncio
+import collections
+import functools
+import threading
+import time
 
 import lbrytools.funcs as funcs
 
+try:
+    import httpx
+    HTTPX_LOADED = True
+except ModuleNotFoundError:
+    HTTPX_LOADED = False
+
+# Characters that separate the parts of a URI, so they can't be in a name
+URI_SEPARATORS = frozenset("#:@")
+HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+# Maximum number of claims returned by `claim_search` in one page
+CLAIM_SEARCH_PAGE = 50
+
+# Responses of `resolve` and `claim search` that found a claim
+# are reused for `SEARCH_TTL` seconds; errors and empty results
+# are never kept, so a claim that failed once is searched again.
+# The raw bytes are kept so every caller parses its own copy
+# and cannot modify the cached result.
+SEARCH_TTL = 60
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE = collections.OrderedDict()
+SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def cache_get(key):
+    """Return the cached raw response for `key`, or `None`."""
+    with SEARCH_CACHE_LOCK:
+        entry = SEARCH_CACHE.get(key)
+
+        if entry is None:
+            return None
+
+        expires, content = entry
+
+        if expires < time.monotonic():
+            del SEARCH_CACHE[key]
+            return None
+
+        SEARCH_CACHE.move_to_end(key)
+        return content
+
+
+def cache_put(key, content):
+    """Keep the raw response for `key` for `SEARCH_TTL` seconds."""
+    with SEARCH_CACHE_LOCK:
+        SEARCH_CACHE[key] = (time.monotonic() + SEARCH_TTL, content)
+        SEARCH_CACHE.move_to_end(key)
+
+        while len(SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            SEARCH_CACHE.popitem(last=False)
+
+
+def resolve_uri_cached(uri, server, cache=True):
+    """Return the decoded `lbrynet resolve` response for a URI.
+
+    A response that resolved the URI is cached;
+    with `cache=False` the cache is neither read nor filled.
+    """
+    key = ("resolve", uri, server)
+    content = cache_get(key) if cache else None
+
+    if content is not None:
+        return funcs.json_loads(content)
+
+    msg = {"method": "resolve",
+           "params": {"urls": uri}}
+
+    content = funcs.post_raw(server, msg)
+    output = funcs.json_loads(content)
+
+    item = output.get("result", {}).get(uri)
+
+    if cache and item and "error" not in item:
+        cache_put(key, content)
+
+    return output
+
+
+def claim_search_cached(cid, name, server, cache=True):
+    """Return the decoded `lbrynet claim search` response for a claim.
+
+    If both `cid` and `name` are given, `cid` is used.
+    Only the oldest matching claim is requested, which is the original
+    one if there are various reposts.
+    A response that found the claim is cached;
+    with `cache=False` the cache is neither read nor filled.
+    """
+    key = ("claim_search", cid, name, server)
+    content = cache_get(key) if cache else None
+
+    if content is not None:
+        return funcs.json_loads(content)
+
+    if cid:
+        msg = {"method": "claim_search",
+               "params": {"claim_id": cid}}
+    else:
+        msg = {"method": "claim_search",
+               "params": {"name": name}}
+
+    msg["params"].update({"page_size": 1,
+                          "order_by": ["^creation_height"]})
+
+    content = funcs.post_raw(server, msg)
+    output = funcs.json_loads(content)
+
+    if cache and output.get("result", {}).get("items"):
+        cache_put(key, content)
+
+    return output
 
-def check_repost(item, repost=True):
+
+def clear_cache():
+    """Forget the cached responses of `resolve` and `claim search`.
+
+    Call it after an operation that changes claims, such as adding
+    or removing a support, so the next search gets fresh values.
+    """
+    with SEARCH_CACHE_LOCK:
+        SEARCH_CACHE.clear()
+
+
+def check_repost(item, repost=True, verbose=True):
     """Check if the item is a repost, and return the original item.
 
     A claim that is just the repost of another cannot be downloaded directly,
@@ -47,6 +170,11 @@ def check_repost(item, repost=True):
         will be the reposted claim, that is,
         the value of `item['reposted_claim']`.
         If it's `False` it will return the original input `item`.
+    verbose: bool, optional
+        It defaults to `True`, in which case it will print the URLs
+        of the repost and of the reposted claim.
+        If it is `False` nothing will be printed; this is useful when
+        many claims are resolved in parallel.
 
     Returns
     -------
@@ -59,10 +187,11 @@ def check_repost(item, repost=True):
         old_uri = item["canonical_url"]
         uri = item["reposted_claim"]["canonical_url"]
 
-        print("This is a repost.")
-        print(f"canonical_url:  {old_uri}")
-        print(f"reposted_claim: {uri}")
-        print()
+        if verbose:
+            print("This is a repost.")
+            print(f"canonical_url:  {old_uri}")
+            print(f"reposted_claim: {uri}")
+            print()
 
         if repost:
             item = item["reposted_claim"]
@@ -70,8 +199,8 @@ def check_repost(item, repost=True):
     return item
 
 
-def search_item_uri(uri=None, repost=True,
-                    print_error=True,
+def search_item_uri(uri=None, repost=True, verbose=True,
+                    print_error=True, cache=True,
                     server="http://localhost:5279"):
     """Find a single item in the LBRY network, resolving the URI.
 
@@ -91,12 +220,22 @@ def search_item_uri(uri=None, repost=True,
         is a repost, and if it is, it will return the original claim.
         If it is `False`, it won't check for a repost, it will simply return
         the found claim.
+    verbose: bool, optional
+        It defaults to `True`, in which case it will print a message
+        if the claim is a repost.
+        If it is `False` nothing is printed about reposts;
+        this is useful when many claims are searched in threads.
     print_error: bool, optional
         It defaults to `True`, in which case it will print the error message
         that `lbrynet resolve` returns.
         By setting this value to `False` no messages will be printed;
         this is useful inside other functions when we want to limit
         the terminal output.
+    cache: bool, optional
+        It defaults to `True`, in which case a claim found online
+        in the last `SEARCH_TTL` seconds is taken from the cache.
+        If it is `False` the server is always asked; this should be used
+        when the result decides an amount of LBC to spend or abandon.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -125,14 +264,7 @@ def search_item_uri(uri=None, repost=True,
         print(f"uri={uri}")
         return False
 
-    cmd = ["lbrynet",
-           "resolve",
-           uri]
-
-    msg = {"method": cmd[1],
-           "params": {"urls": uri}}
-
-    output = requests.post(server, json=msg).json()
+    output = resolve_uri_cached(uri, server, cache=cache)
 
     if "error" in output:
         print(">>> No 'result' in the JSON-RPC server output")
@@ -155,14 +287,14 @@ def search_item_uri(uri=None, repost=True,
 
     # The found item may be a repost so we check it,
     # and return the original source item.
-    item = check_repost(item, repost=repost)
+    item = check_repost(item, repost=repost, verbose=verbose)
 
     return item
 
 
 def search_item_cid(cid=None, name=None,
-                    repost=True, offline=False,
-                    print_error=True,
+                    repost=True, verbose=True, offline=False,
+                    print_error=True, cache=True,
                     server="http://localhost:5279"):
     """Find a single item in the LBRY network, resolving the claim id or name.
 
@@ -184,6 +316,11 @@ def search_item_cid(cid=None, name=None,
         is a repost, and if it is, it will return the original claim.
         If it is `False`, it won't check for a repost, it will simply return
         the found claim.
+    verbose: bool, optional
+        It defaults to `True`, in which case it will print a message
+        if the claim is a repost.
+        If it is `False` nothing is printed about reposts;
+        this is useful when many claims are searched in threads.
     offline: bool, optional
         It defaults to `False`, in which case it will use
         `lbrynet claim search` to search `cid` or `name` in the online
@@ -203,6 +340,11 @@ def search_item_cid(cid=None, name=None,
         By setting this value to `False` no messages will be printed;
         this is helpful if this function is used inside other functions,
         and we want to limit the terminal output.
+    cache: bool, optional
+        It defaults to `True`, in which case a claim found online
+        in the last `SEARCH_TTL` seconds is taken from the cache.
+        If it is `False` the server is always asked; this should be used
+        when the result decides an amount of LBC to spend or abandon.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -222,45 +364,35 @@ def search_item_cid(cid=None, name=None,
     if not funcs.server_exists(server=server):
         return False
 
+    # A claim ID is a hexadecimal string, full or partial
     if (name and (not isinstance(name, str)
-                  or "#" in name or ":" in name or "@" in name)
+                  or not URI_SEPARATORS.isdisjoint(name))
             or cid and (not isinstance(cid, str)
-                        or "#" in cid or ":" in cid or "@" in cid)
+                        or not HEX_DIGITS.issuperset(cid))
             or not (name or cid)):
-        m = ["Search by 'name' or 'claim_id' only.",
-             "lbry://@MyChannel#3/some-video-name#2",
-             "                    ^-------------^",
-             "                          name"]
-        print("\n".join(m))
-        print(f"cid={cid}")
-        print(f"name={name}")
+        if print_error:
+            m = ["Search by 'name' or 'claim_id' only.",
+                 "lbry://@MyChannel#3/some-video-name#2",
+                 "                    ^-------------^",
+                 "                          name"]
+            print("\n".join(m))
+            print(f"cid={cid}")
+            print(f"name={name}")
         return False
 
+    # Only the online search is memoized; the downloaded files
+    # listed by `file list` change when files are deleted.
     if offline:
-        cmd = ["lbrynet",
-               "file",
-               "list",
-               "--claim_name='{}'".format(name)]
         if cid:
-            cmd[3] = "--claim_id=" + cid
+            msg = {"method": "file_list",
+                   "params": {"claim_id": cid}}
+        else:
+            msg = {"method": "file_list",
+                   "params": {"claim_name": name}}
 
-        msg = {"method": cmd[1] + "_" + cmd[2],
-               "params": {"claim_name": name}}
+        output = funcs.post_json(server, msg)
     else:
-        cmd = ["lbrynet",
-               "claim",
-               "search",
-               "--name={}".format(name)]
-        if cid:
-            cmd[3] = "--claim_ids=" + cid
-
-        msg = {"method": cmd[1] + "_" + cmd[2],
-               "params": {"name": name}}
-
-    if cid:
-        msg["params"] = {"claim_id": cid}
-
-    output = requests.post(server, json=msg).json()
+        output = claim_search_cached(cid, name, server, cache=cache)
 
     if "error" in output:
         print(">>> No 'result' in the JSON-RPC server output")
@@ -270,12 +402,8 @@ def search_item_cid(cid=None, name=None,
 
     if "blocked" in data and data["blocked"]["total"] > 0:
         chs = data["blocked"]["channels"]
-        blks = []
-
-        for blocking in chs:
-            blk = blocking["channel"]["canonical_url"].split("lbry://")[1]
-            blks.append(blk)
-
+        blks = [funcs.short_uri(blocking["channel"]["canonical_url"])
+                for blocking in chs]
         ch = " ; ".join(blks)
 
         print(">>> Claim blocked by hub.")
@@ -297,19 +425,20 @@ def search_item_cid(cid=None, name=None,
         return False
 
     # The list of items may include various reposts;
-    # usually the last item is the oldest and thus the original.
+    # online, only the oldest is requested, and it is the original.
+    # Offline, usually the last item is the oldest.
     item = data["items"][-1]
 
     # The found item may be a repost so we check it,
     # and return the original source item.
-    item = check_repost(item, repost=repost)
+    item = check_repost(item, repost=repost, verbose=verbose)
 
     return item
 
 
 def search_item(uri=None, cid=None, name=None,
-                repost=True, offline=False,
-                print_error=True,
+                repost=True, verbose=True, offline=False,
+                print_error=True, cache=True,
                 server="http://localhost:5279"):
     """Find a single item in the LBRY network resolving URI, claim id, or name.
 
@@ -341,6 +470,11 @@ def search_item(uri=None, cid=None, name=None,
         is a repost, and if it is, it will return the original claim.
         If it is `False`, it won't check for a repost, it will simply return
         the found claim.
+    verbose: bool, optional
+        It defaults to `True`, in which case it will print a message
+        if the claim is a repost.
+        If it is `False` nothing is printed about reposts;
+        this is useful when many claims are searched in threads.
     offline: bool, optional
         It defaults to `False`, in which case it will use
         `lbrynet claim search` to search `cid` or `name` in the online
@@ -361,6 +495,11 @@ def search_item(uri=None, cid=None, name=None,
         If it is `False` no error messages will be printed;
         this is useful inside other functions when we want to limit
         the terminal output.
+    cache: bool, optional
+        It defaults to `True`, in which case a claim found online
+        in the last `SEARCH_TTL` seconds is taken from the cache.
+        If it is `False` the server is always asked; this should be used
+        when the result decides an amount of LBC to spend or abandon.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -391,19 +530,23 @@ def search_item(uri=None, cid=None, name=None,
             name = uri
 
         item = search_item_cid(cid=cid, name=name,
-                               repost=repost, offline=offline,
+                               repost=repost, verbose=verbose,
+                               offline=offline,
                                print_error=print_error,
                                server=server)
     else:
         if uri:
             item = search_item_uri(uri=uri,
-                                   repost=repost,
+                                   repost=repost, verbose=verbose,
                                    print_error=print_error,
+                                   cache=cache,
                                    server=server)
         else:
             item = search_item_cid(cid=cid, name=name,
-                                   repost=repost, offline=offline,
+                                   repost=repost, verbose=verbose,
+                                   offline=offline,
                                    print_error=print_error,
+                                   cache=cache,
                                    server=server)
 
     if not item and print_error:
@@ -414,38 +557,318 @@ def search_item(uri=None, cid=None, name=None,
     return item
 
 
+def resolve_batch(uris,
+                  server="http://localhost:5279"):
+    """Resolve many URLs with a single `lbrynet resolve` request.
+
+    Returns
+    -------
+    dict
+        A dictionary where each key is one of the input URLs,
+        and the value is the dictionary of the claim if it was found,
+        or a dictionary with the `'error'` key if it was not.
+        It is empty if the server returned an error for the whole request.
+    """
+    msg = {"method": "resolve",
+           "params": {"urls": list(uris)}}
+
+    output = funcs.post_json(server, msg)
+
+    if "error" in output:
+        return {}
+
+    return output["result"]
+
+
+def claim_ids_msg(cids):
+    """Return the `claim_search` message to search many claim IDs at once."""
+    return {"method": "claim_search",
+            "params": {"claim_ids": cids,
+                       "page_size": len(cids),
+                       "no_totals": True}}
+
+
+def search_claim_ids(cids,
+                     server="http://localhost:5279"):
+    """Search many claim IDs with a single `lbrynet claim search` request.
+
+    At most `CLAIM_SEARCH_PAGE` claim IDs should be given.
+
+    Returns
+    -------
+    dict
+        A dictionary where each key is one of the input claim IDs
+        that was found online, and the value is the dictionary of the claim.
+        It is empty if the server returned an error.
+    """
+    output = funcs.post_json(server, claim_ids_msg(cids))
+    return claims_by_id(output)
+
+
+def claims_by_id(output):
+    """Return the claims of a `claim_search` output, by claim ID."""
+    if "error" in output:
+        return {}
+
+    return {item["claim_id"]: item for item in output["result"]["items"]}
+
+
+def async_client(connections=32):
+    """Return an asynchronous client with the timeouts of `funcs.SESSION`."""
+    limits = httpx.Limits(max_connections=connections,
+                          max_keepalive_connections=connections)
+    timeout = httpx.Timeout(funcs.READ_TIMEOUT,
+                            connect=funcs.CONNECT_TIMEOUT)
+
+    return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+async def post_json_async(client, server, msg):
+    """Coroutine to send a JSON-RPC message and return the decoded output.
+
+    If the request fails, it returns a dictionary with the `'error'` key,
+    like `funcs.post_json`.
+    """
+    try:
+        response = await client.post(server,
+                                     content=funcs.json_dumps(msg),
+                                     headers={"Content-Type":
+                                              "application/json"})
+    except httpx.HTTPError as err:
+        return {"error": {"message": f"{msg['method']}: {err}"}}
+
+    return funcs.json_loads(response.content)
+
+
+async def search_claim_ids_async(client, cids, semaphore,
+                                 server="http://localhost:5279"):
+    """Coroutine to search a group of claim IDs with a single request."""
+    async with semaphore:
+        output = await post_json_async(client, server, claim_ids_msg(cids))
+
+    return claims_by_id(output)
+
+
+async def w_search_claim_ids_async(groups, connections=32,
+                                   server="http://localhost:5279"):
+    """Wrapper to search groups of claim IDs with a single client.
+
+    It returns a list with the output of `search_claim_ids`
+    for each group.
+    """
+    semaphore = asyncio.Semaphore(connections)
+
+    async with async_client(connections) as client:
+        tasks = [search_claim_ids_async(client, cids, semaphore,
+                                        server=server)
+                 for cids in groups]
+        return await asyncio.gather(*tasks)
+
+
+def resolve_urls(urls, batch_size=200,
+                 server="http://localhost:5279"):
+    """Resolve URLs in batches, yielding a pair `(url, item)` for each one.
+
+    The `item` is the resolved claim, or `False` if it was not found.
+    Reposts are not replaced by the reposted claim.
+    """
+    for start in range(0, len(urls), batch_size):
+        batch = urls[start:start + batch_size]
+        output = resolve_batch(batch, server=server)
+
+        for url in batch:
+            item = output.get(url)
+            if item and "error" not in item:
+                yield url, item
+            else:
+                yield url, False
+
+
+def is_claim_id(claim):
+    """Return True if the string has the shape of a full claim ID."""
+    return len(claim) == 40 and HEX_DIGITS.issuperset(claim)
+
+
+def claim_result(original, item):
+    """Return the result of resolving a claim, without printing anything.
+
+    If the found `item` is a repost, it is replaced by the reposted claim,
+    and the `'canonical_url'` of the repost is kept in `'repost'`.
+    """
+    result = {"original": original,
+              "resolved": item,
+              "repost": False}
+
+    if item and "reposted_claim" in item:
+        result["resolved"] = check_repost(item, repost=True, verbose=False)
+        result["repost"] = item["canonical_url"]
+
+    return result
+
+
 def search_th(claim,
               server="http://localhost:5279"):
-    """Method to resolve a claim using threads."""
-    result = search_item(uri=claim, repost=True,
-                         print_error=False,
-                         server=server)
+    """Method to resolve a claim by claim ID using threads."""
+    # The repost is replaced in `claim_result`, as in `search_async`,
+    # so nothing is printed from the worker threads
+    item = search_item(cid=claim, repost=False, verbose=False,
+                       print_error=False,
+                       server=server)
 
-    if not result:
-        result = search_item(cid=claim, repost=True,
-                             print_error=False,
-                             server=server)
+    return claim_result(claim, item)
 
-    return {"original": claim,
-            "resolved": result}
 
+async def search_async(client, claim, semaphore,
+                       server="http://localhost:5279"):
+    """Coroutine to resolve a claim by claim ID."""
+    # Same check as in `search_item_cid`; skip the request
+    # if the input cannot be a claim ID
+    if not HEX_DIGITS.issuperset(claim):
+        return claim_result(claim, False)
 
-def resolve_claims(claims, threads=32,
+    async with semaphore:
+        msg = {"method": "claim_search",
+               "params": {"claim_id": claim,
+                          "page_size": 1,
+                          "order_by": ["^creation_height"]}}
+        output = await post_json_async(client, server, msg)
+
+    item = False
+    if "error" not in output and output["result"]["total_items"] > 0:
+        item = output["result"]["items"][-1]
+
+    return claim_result(claim, item)
+
+
+async def w_resolve_async(claims, connections=32,
+                          server="http://localhost:5279"):
+    """Wrapper to resolve many claims concurrently with a single client."""
+    semaphore = asyncio.Semaphore(connections)
+
+    async with async_client(connections) as client:
+        tasks = [search_async(client, claim, semaphore, server=server)
+                 for claim in claims]
+        resolved = await asyncio.gather(*tasks)
+
+    return list(resolved)
+
+
+def search_claims_iter(claims, threads=32, asynchronous=False,
+                       server="http://localhost:5279"):
+    """Search a list of claim IDs, yielding each one as soon as it is ready."""
+    if not claims:
+        return
+
+    # No more threads or connections than claims
+    threads = min(threads, len(claims))
+
+    if asynchronous:
+        yield from asyncio.run(w_resolve_async(claims,
+                                               connections=threads or 1,
+                                               server=server))
+    elif threads:
+        search = functools.partial(search_th, server=server)
+
+        for _, result in funcs.run_limited(search, claims, threads):
+            yield result
+    else:
+        for claim in claims:
+            yield search_th(claim, server=server)
+
+
+def resolve_claims_iter(claims, threads=32, asynchronous=False,
+                        server="http://localhost:5279"):
+    """Resolve a list of claims, yielding each one as soon as it is ready.
+
+    The claims are not yielded in the same order as the input list.
+    See `resolve_claims` for the meaning of the parameters.
+    """
+    # What looks like a claim ID is searched by claim ID first,
+    # and the rest is resolved by URL first, so that most claims
+    # only need one request.
+    missing = []
+    urls = []
+
+    for claim in claims:
+        if is_claim_id(claim):
+            missing.append(claim)
+        else:
+            urls.append(claim)
+
+    for url, item in resolve_urls(urls, server=server):
+        if item:
+            yield claim_result(url, item)
+        else:
+            missing.append(url)
+
+    retry = []
+
+    for res in search_claims_iter(missing, threads=threads,
+                                  asynchronous=asynchronous,
+                                  server=server):
+        if not res["resolved"] and is_claim_id(res["original"]):
+            retry.append(res["original"])
+        else:
+            yield res
+
+    # A name may also look like a claim ID
+    for url, item in resolve_urls(retry, server=server):
+        yield claim_result(url, item)
+
+
+def resolve_claims(claims, threads=32, asynchronous=False, stream=False,
                    server="http://localhost:5279"):
     """Resolve a list of claims, whether claim IDs or URLs are given.
 
-    First it tries resolving the item by URL, and if that fails it tries
-    by claim ID.
+    Items that look like a claim ID (40 hexadecimal characters)
+    are searched by claim ID, one by one.
+    The rest are resolved by URL, sending many URLs
+    in each `lbrynet resolve` request.
+    The items that fail are then tried in the other form.
+
+    Parameters
+    ----------
+    claims: list of str
+        Each element is a URL (canonical url) or a claim ID
+        (40-character alphanumeric string) of a claim on the LBRY network.
+    threads: int, optional
+        It defaults to 32.
+        It is the maximum number of threads that will be used to search
+        the claims by claim ID at the same time.
+        If it is 0, the claims will be searched one after the other.
+    asynchronous: bool, optional
+        It defaults to `False`.
+        If it is `True` the claims will be searched by coroutines
+        in a single thread, sharing one `httpx.AsyncClient`,
+        and `threads` will be the maximum number of simultaneous requests.
+        This option requires the `httpx` package to be installed,
+        and it cannot be used from a running event loop.
+    stream: bool, optional
+        It defaults to `False`, in which case all claims are resolved
+        before returning the list.
+        If it is `True` it will return a generator that yields
+        each resolved claim as soon as it is ready, not in the input order,
+        so the results don't need to be kept in memory all at once.
+    server: str, optional
+        It defaults to `'http://localhost:5279'`.
+        This is the address of the `lbrynet` daemon, which should be running
+        in your computer before using any `lbrynet` command.
+        Normally, there is no need to change this parameter from its default
+        value.
 
     Returns
     -------
     list of dict
         It returns a list of dictionaries, one for each claim
-        in the input list. Each dictionary has two keys:
+        in the input list. Each dictionary has three keys:
         - 'original': original input URL or claim ID (40-digit alphanumeric)
         - 'resolved': the resolved information of the claim, if it was found,
           or the value `False` if it was not found.
-
+          If the claim is a repost, it is the reposted claim.
+        - 'repost': the `'canonical_url'` of the repost,
+          or `False` if the claim is not a repost.
+    generator of dict
+        If `stream=True`, the same dictionaries are yielded one by one.
     False
         If there is a problem or non existing `file`,
         it will return `False`.
@@ -453,23 +876,23 @@ def resolve_claims(claims, threads=32,
     if not funcs.server_exists(server=server):
         return False
 
-    resolved = []
-    n_claims = len(claims)
+    if not claims:
+        return iter([]) if stream else []
 
-    servers = (server for n in range(n_claims))
+    if asynchronous and not HTTPX_LOADED:
+        print("Asynchronous resolution requires the `httpx` package; "
+              "using threads.")
+        asynchronous = False
 
-    if threads:
-        with fts.ThreadPoolExecutor(max_workers=threads) as executor:
-            # The input must be iterables
-            results = executor.map(search_th,
-                                   claims, servers)
+    results = resolve_claims_iter(claims, threads=threads,
+                                  asynchronous=asynchronous,
+                                  server=server)
 
-            resolved = list(results)  # generator to list
-    else:
-        for claim in claims:
-            res = search_th(claim, server=server)
+    if stream:
+        return results
 
-            resolved.append(res)
+    found = {res["original"]: res for res in results}
+    resolved = [found[claim] for claim in claims]
 
     return resolved
 
@@ -28,6 +28,9 @@
 These methods are used with lists of claims returned by `claim_search`.
 """
 
+# Bytes in a gibibyte
+GIB = 1 << 30
+
 
 def sort_and_filter(claims, number=0, reverse=False):
     """Sort the input list and remove duplicated items with same claim ID.
@@ -53,42 +56,64 @@ def sort_and_filter(claims, number=0, reverse=False):
         removed.
     """
     print("Sort claims and remove duplicates")
-    new_items = []
     n_claims = len(claims)
 
+    # Only the newest claim with each claim ID is kept
+    newest = {}
+
     # Make sure the `release_time` exists, and use `timestamp` otherwise
     for num, claim in enumerate(claims, start=1):
-        if "release_time" not in claim["value"]:
+        release_time = claim["value"].get("release_time")
+
+        if release_time is None:
             name = claim["name"]
             print(f'{num:4d}/{n_claims:4d}; "{name}" using "timestamp"')
-            claim["value"]["release_time"] = claim["timestamp"]
-        new_items.append(claim)
+            release_time = claim["timestamp"]
+            claim["value"]["release_time"] = release_time
 
-    # Sort by using the original `release_time`.
-    # New items will come first.
-    sorted_items = sorted(new_items,
-                          key=lambda v: int(v["value"]["release_time"]),
-                          reverse=True)
+        release_time = int(release_time)
+        cid = claim["claim_id"]
 
-    unique_ids = []
-    unique_claims = []
+        # The negative position keeps the input order of claims
+        # with the same `release_time`, and the tuples are compared
+        # without reaching the dictionaries
+        if cid not in newest or release_time > newest[cid][0]:
+            newest[cid] = (release_time, -num, claim)
 
-    for item in sorted_items:
-        if item["claim_id"] not in unique_ids:
-            unique_claims.append(item)
-            unique_ids.append(item["claim_id"])
+    # Sort by using the original `release_time`.
+    # Older items come first, or new items if `reverse=True`.
+    sorted_items = sorted(newest.values(), reverse=reverse)
 
     if number:
         # Cut the older items
-        unique_claims = unique_claims[0:number]
+        if reverse:
+            sorted_items = sorted_items[0:number]
+        else:
+            sorted_items = sorted_items[-number:]
 
-    if not reverse:
-        # Invert the list so that older items appear first
-        unique_claims.reverse()
+    unique_claims = [item[2] for item in sorted_items]
 
     return unique_claims
 
 
+def source_size(source_info):
+    """Return the size in bytes of the source of a claim, or 0."""
+    source = source_info.get("source")
+    if source is None:
+        return 0
+    return int(source.get("size", 0))
+
+
+def source_duration(source_info):
+    """Return the duration in seconds of a video or audio claim, or 0."""
+    stream = source_info.get("video")
+    if stream is None:
+        stream = source_info.get("audio")
+    if stream is None:
+        return 0
+    return int(stream.get("duration", 0))
+
+
 def downloadable_size(claims, local=False, print_msg=True):
     """Calculate the total size of input claims.
 
@@ -131,39 +156,27 @@ def downloadable_size(claims, local=False, print_msg=True):
             print("Calculate size of downloadable claims")
 
     n_claims = len(claims)
-    total_bytes = 0
-    total_seconds = 0
 
-    for num, claim in enumerate(claims, start=1):
-        if local:
-            vtype = claim["mime_type"]
-            source_info = claim["metadata"]
-            alt_name = claim["stream_name"]
-        else:
-            vtype = claim["value_type"]
-            source_info = claim["value"]
-            alt_name = claim["name"]
+    if local:
+        info_key, name_key, type_key = "metadata", "stream_name", "mime_type"
+    else:
+        info_key, name_key, type_key = "value", "name", "value_type"
 
-        if "source" in source_info:
-            file_name = source_info["source"].get("name", "None")
-            size = int(source_info["source"].get("size", 0))
-        else:
-            file_name = alt_name
-            size = 0
-            if print_msg:
-                print(f"{num:4d}/{n_claims:4d}; type: {vtype}; "
-                      f'no source: "{file_name}"')
+    sources = [claim[info_key] for claim in claims]
 
-        seconds = 0
-        if "video" in source_info:
-            seconds = source_info["video"].get("duration", 0)
-        elif "audio" in source_info:
-            seconds = source_info["audio"].get("duration", 0)
+    total_bytes = sum(map(source_size, sources))
+    total_seconds = sum(map(source_duration, sources))
 
-        total_bytes += size
-        total_seconds += seconds
+    if print_msg:
+        for num, (claim, source_info) in enumerate(zip(claims, sources),
+                                                   start=1):
+            if "source" not in source_info:
+                vtype = claim[type_key]
+                file_name = claim[name_key]
+                print(f"{num:4d}/{n_claims:4d}; type: {vtype}; "
+                      f'no source: "{file_name}"')
 
-    size_gb = total_bytes / (1024**3)
+    size_gb = total_bytes / GIB
     hrs = total_seconds / 3600
     days = hrs / 24
 
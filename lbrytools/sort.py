@@ -24,9 +24,9 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Functions to help with sorting downloaded claims from the LBRY network."""
+import asyncio
 import concurrent.futures as fts
-
-import requests
+import functools
 
 import lbrytools.funcs as funcs
 import lbrytools.search as srch
@@ -34,6 +34,27 @@ import lbrytools.search_utils as sutils
 import lbrytools.resolve_ch as resch
 
 
+def resolve_channel_cached(channel, server):
+    """Resolve a channel, reusing a recent result, see `sort_items`.
+
+    Only a channel that was found is kept, in the same cache
+    as the searches of `search.py`, so it expires after
+    `search.SEARCH_TTL` seconds and is dropped by `search.clear_cache`.
+    """
+    key = ("channel", channel, server)
+    content = srch.cache_get(key)
+
+    if content is not None:
+        return funcs.json_loads(content)
+
+    ch = resch.resolve_channel(channel=channel, server=server)
+
+    if ch:
+        srch.cache_put(key, funcs.json_dumps(ch))
+
+    return ch
+
+
 def sort_items(channel=None, reverse=False,
                server="http://localhost:5279"):
     """Return a list of claims that were downloaded, sorted by time.
@@ -81,7 +102,9 @@ def sort_items(channel=None, reverse=False,
     if not funcs.server_exists(server=server):
         return False
 
-    page_size = 99000
+    # Large lists are requested in several pages so the daemon doesn't
+    # have to serialize all items in a single response
+    page_size = 5000
     cmd = ["lbrynet",
            "file",
            "list",
@@ -108,18 +131,28 @@ def sort_items(channel=None, reverse=False,
         # A bug (lbryio/lbry-sdk #3316) prevents the `lbrynet file list`
         # command from finding the channel, therefore the channel must be
         # resolved with `lbrynet resolve` before it becomes known by other
-        # functions.
-        ch = resch.resolve_channel(channel=channel, server=server)
+        # functions. Once resolved, it stays known to the daemon.
+        ch = resolve_channel_cached(channel, server)
         if not ch:
             return False
 
-    output = requests.post(server, json=msg).json()
+    items = []
+    page = 1
 
-    if "error" in output:
-        print(">>> No 'result' in the JSON-RPC server output")
-        return False
+    while True:
+        msg["params"]["page"] = page
+        output = funcs.post_json(server, msg,
+                                 read_timeout=funcs.LONG_READ_TIMEOUT)
 
-    items = output["result"]["items"]
+        if "error" in output:
+            print(">>> No 'result' in the JSON-RPC server output")
+            return False
+
+        items.extend(output["result"]["items"])
+
+        if page >= output["result"].get("total_pages", 1):
+            break
+        page += 1
 
     n_items = len(items)
 
@@ -133,34 +166,38 @@ def sort_items(channel=None, reverse=False,
 
     print(f"Number of items: {n_items}")
 
-    new_items = []
+    decorated = []
 
     # Older claims may not have 'release_time'; we use the 'timestamp' instead
     for it, item in enumerate(items, start=1):
-        if "release_time" not in item["metadata"]:
+        release_time = item["metadata"].get("release_time")
+
+        if release_time is None:
             print(f"{it}/{n_items}, {item['claim_name']}, using 'timestamp'")
-            item["metadata"]["release_time"] = item["timestamp"]
-        new_items.append(item)
+            release_time = item["timestamp"]
+            item["metadata"]["release_time"] = release_time
+
+        # The position keeps the input order of items with the same time
+        position = -it if reverse else it
+        decorated.append((int(release_time), position, item))
 
     # Sort by using the original 'release_time'; older items first
-    sorted_items = sorted(new_items,
-                          key=lambda v: int(v["metadata"]["release_time"]),
-                          reverse=reverse)
+    decorated.sort(reverse=reverse)
+    sorted_items = [d[2] for d in decorated]
 
     return sorted_items
 
 
-def search_item_th(cid, server):
-    """Wrapper to use with threads in `sort_invalid`."""
-    s = srch.search_item(cid=cid,
-                         offline=False, print_error=False,
-                         server=server)
+def search_cids_th(cids, server):
+    """Wrapper to use with threads in `sort_invalid`.
 
-    return s
+    It returns the set of the claim IDs in `cids` that were found online.
+    """
+    return set(srch.search_claim_ids(cids, server=server))
 
 
 def sort_invalid(channel=None, reverse=False,
-                 threads=32,
+                 threads=32, asynchronous=False,
                  server="http://localhost:5279"):
     """Return a list of invalid claims that were previously downloaded.
 
@@ -187,8 +224,17 @@ def sort_invalid(channel=None, reverse=False,
     threads: int, optional
         It defaults to 32.
         It is the number of threads that will be used to resolve claims,
-        meaning claims that will be searched in parallel.
+        meaning groups of claims that will be searched in parallel.
+        Each group has up to 50 claims, searched with a single
+        `lbrynet claim search` request.
         This number shouldn't be large if the CPU doesn't have many cores.
+    asynchronous: bool, optional
+        It defaults to `False`.
+        If it is `True` the groups of claims will be searched by coroutines
+        in a single thread, sharing one `httpx.AsyncClient`,
+        and `threads` will be the maximum number of simultaneous requests.
+        This option requires the `httpx` package to be installed;
+        otherwise threads are used.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -226,31 +272,43 @@ def sort_invalid(channel=None, reverse=False,
 
     invalid_items = []
 
-    # Iterables to be passed to the ThreadPoolExecutor
-    results = []
-    cids = (item["claim_id"] for item in items)
-    servers = (server for n in range(n_items))
-
-    if threads:
+    # Many claim IDs are searched in each request
+    cids = [item["claim_id"] for item in items]
+    groups = [cids[start:start + srch.CLAIM_SEARCH_PAGE]
+              for start in range(0, n_items, srch.CLAIM_SEARCH_PAGE)]
+
+    found = set()
+
+    if asynchronous and not srch.HTTPX_LOADED:
+        print("Asynchronous search requires the `httpx` package; "
+              "using threads.")
+        asynchronous = False
+
+    if asynchronous:
+        # A single client keeps many requests in flight from one thread
+        results = asyncio.run(
+            srch.w_search_claim_ids_async(groups,
+                                          connections=threads or 1,
+                                          server=server))
+        for result in results:
+            found.update(result)
+    elif threads:
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
-            # The input must be iterables
-            results = executor.map(search_item_th,
-                                   cids, servers)
-            results = list(results)  # generator to list
-    else:
-        for item in items:
-            s = search_item_th(item["claim_id"], server)
-            results.append(s)
+            search = functools.partial(search_cids_th, server=server)
+            results = executor.map(search, groups)
 
-    for num, pair in enumerate(zip(items, results), start=1):
-        item = pair[0]
-        resolved = pair[1]
+            # Each group is added as soon as it is ready
+            for result in results:
+                found.update(result)
+    else:
+        for group in groups:
+            found.update(search_cids_th(group, server))
 
-        if not resolved:
+    for num, (item, claim_id) in enumerate(zip(items, cids), start=1):
+        if claim_id not in found:
             if len(invalid_items) == 0:
                 print()
 
-            claim_id = item["claim_id"]
             claim_name = item["claim_name"]
             channel = item["channel_name"]
             print(f"Claim {num:4d}/{n_items:4d}, "
@@ -268,7 +326,7 @@ def sort_invalid(channel=None, reverse=False,
 
 
 def sort_items_size(channel=None, reverse=False, invalid=False,
-                    threads=32,
+                    threads=32, asynchronous=False,
                     server="http://localhost:5279"):
     """Return a list of claims that were downloaded, their size and length.
 
@@ -299,6 +357,10 @@ def sort_items_size(channel=None, reverse=False, invalid=False,
         It is the number of threads that will be used to resolve claims,
         meaning claims that will be searched in parallel.
         This number shouldn't be large if the CPU doesn't have many cores.
+    asynchronous: bool, optional
+        It defaults to `False`.
+        If it is `True`, and `invalid=True`, the claims will be searched
+        by coroutines instead of threads. See `sort_invalid`.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -339,7 +401,7 @@ def sort_items_size(channel=None, reverse=False, invalid=False,
 
     if invalid:
         claims = sort_invalid(channel=channel, reverse=reverse,
-                              threads=threads,
+                              threads=threads, asynchronous=asynchronous,
                               server=server)
     else:
         claims = sort_items(channel=channel, reverse=reverse,
@@ -25,6 +25,7 @@
 # --------------------------------------------------------------------------- #
 """Functions to display channel information like subscriptions."""
 import concurrent.futures as fts
+import itertools
 import time
 
 import requests
@@ -198,7 +199,7 @@ def search_ch_subs(shared=True,
     res_channels = []
 
     # Iterables to be passed to the ThreadPoolExecutor
-    servers = (server for n in range(n_channels))
+    servers = itertools.repeat(server, n_channels)
 
     if threads:
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
@@ -472,8 +473,8 @@ def search_ch_subs_latest(number=4, override=False,
 
     # Iterables to be passed to the ThreadPoolExecutor
     n_channels = len(ch_filtered)
-    numbers = (number for n in range(n_channels))
-    servers = (server for n in range(n_channels))
+    numbers = itertools.repeat(number, n_channels)
+    servers = itertools.repeat(server, n_channels)
 
     if threads:
         with fts.ThreadPoolExecutor(max_workers=threads) as executor:
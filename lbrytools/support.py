@@ -24,28 +24,50 @@
 # DEALINGS IN THE SOFTWARE.                                                   #
 # --------------------------------------------------------------------------- #
 """Auxiliary functions for handling supports."""
-import concurrent.futures as fts
-
-import requests
+import asyncio
+import functools
+import operator
+import os
 
 import lbrytools.funcs as funcs
 import lbrytools.search as srch
 
+# Trending scores of a claim, taken from its 'meta' dictionary
+TRENDS = operator.itemgetter("trending_global", "trending_group",
+                             "trending_local", "trending_mixed")
+
+# Amounts and ID of a transaction, taken from its 'result' dictionary
+TX_TOTALS = operator.itemgetter("total_input", "total_output",
+                                "total_fee", "txid")
+
 
-def search_cid_th(cid, server):
-    """Wrapper to use with threads in `get_all_supports`."""
-    s = srch.search_item(cid=cid, server=server)
+def tx_totals(result):
+    """Return the total input, output, fee, and ID of a transaction."""
+    t_input, t_output, t_fee, txid = TX_TOTALS(result)
+    return float(t_input), float(t_output), float(t_fee), txid
 
-    if not s:
-        print()
 
-    return s
+def search_cids_th(cids, server):
+    """Wrapper to use with threads in `get_all_supports`.
+
+    It searches a group of claim IDs with a single request, and returns
+    a dictionary with the claims that were found, by claim ID.
+    """
+    return srch.search_claim_ids(cids, server=server)
 
 
-def get_all_supports(threads=32,
+def get_all_supports(threads=32, asynchronous=False,
                      server="http://localhost:5279"):
     """Get all supports in a dictionary; all, valid, and invalid.
 
+    The supported claims are searched in groups of up to 50 claims,
+    in parallel by `threads` threads.
+    If `asynchronous=True` they are searched by coroutines instead,
+    in a single thread sharing one `httpx.AsyncClient`,
+    with `threads` simultaneous requests.
+    This option requires the `httpx` package to be installed;
+    otherwise threads are used.
+
     Returns
     -------
     dict
@@ -70,7 +92,8 @@ def get_all_supports(threads=32,
 
     msg = {"method": "support_list",
            "params": {"page_size": 99000}}
-    output = requests.post(server, json=msg).json()
+    output = funcs.post_json(server, msg,
+                             read_timeout=funcs.LONG_READ_TIMEOUT)
 
     if "error" in output:
         return False
@@ -86,26 +109,47 @@ def get_all_supports(threads=32,
     valid = []
     invalid = []
 
-    # Iterables to be passed to the ThreadPoolExecutor
-    results = []
-    cids = (support["claim_id"] for support in supports)
-    servers = (server for n in range(n_supports))
-
-    if threads:
-        with fts.ThreadPoolExecutor(max_workers=threads) as executor:
-            # The input must be iterables
-            results = executor.map(search_cid_th,
-                                   cids, servers)
-            results = list(results)  # generator to list
+    # Many claim IDs are searched in each request
+    cids = list(map(operator.itemgetter("claim_id"), supports))
+    groups = [cids[start:start + srch.CLAIM_SEARCH_PAGE]
+              for start in range(0, n_supports, srch.CLAIM_SEARCH_PAGE)]
+
+    found = {}
+
+    if asynchronous and not srch.HTTPX_LOADED:
+        print("Asynchronous search requires the `httpx` package; "
+              "using threads.")
+        asynchronous = False
+
+    if asynchronous:
+        # A single client keeps many requests in flight from one thread
+        results = asyncio.run(
+            srch.w_search_claim_ids_async(groups,
+                                          connections=threads or 1,
+                                          server=server))
+        for result in results:
+            found.update(result)
+    elif threads:
+        # All requests go to the same local daemon, so more threads
+        # than a few per core only add switching between them
+        threads = min(threads, 4 * (os.cpu_count() or 1), len(groups))
+
+        search = functools.partial(search_cids_th, server=server)
+
+        # Each group is added as soon as it is ready, in any order
+        for _, result in funcs.run_limited(search, groups, threads):
+            found.update(result)
     else:
-        for support in supports:
-            s = search_cid_th(support["claim_id"],
-                              server)
-            results.append(s)
+        for group in groups:
+            found.update(search_cids_th(group, server))
+
+    for support in supports:
+        resolved = found.get(support["claim_id"], False)
 
-    for pair in zip(supports, results):
-        support = pair[0]
-        resolved = pair[1]
+        if resolved:
+            # Reposts are replaced by the reposted claims
+            resolved = srch.check_repost(resolved, repost=True,
+                                         verbose=False)
 
         support["resolved"] = resolved
 
@@ -124,7 +168,7 @@ def get_all_supports(threads=32,
 def list_supports(claim_id=False, invalid=False,
                   combine=True, claims=True, channels=True,
                   sanitize=False,
-                  threads=32,
+                  threads=32, asynchronous=False,
                   file=None, fdate=False, sep=";",
                   server="http://localhost:5279"):
     """Print supported claims, the amount, and the trending score.
@@ -161,8 +205,17 @@ def list_supports(claim_id=False, invalid=False,
     threads: int, optional
         It defaults to 32.
         It is the number of threads that will be used to resolve claims,
-        meaning claims that will be searched in parallel.
+        meaning groups of claims that will be searched in parallel.
+        Each group has up to 50 claims, searched with a single
+        `lbrynet claim search` request.
         This number shouldn't be large if the CPU doesn't have many cores.
+    asynchronous: bool, optional
+        It defaults to `False`.
+        If it is `True` the groups of claims will be searched by coroutines
+        in a single thread, sharing one `httpx.AsyncClient`,
+        and `threads` will be the maximum number of simultaneous requests.
+        This option requires the `httpx` package to be installed;
+        otherwise threads are used.
     file: str, optional
         It defaults to `None`.
         It must be a user writable path to which the summary will be written.
@@ -203,7 +256,9 @@ def list_supports(claim_id=False, invalid=False,
     if not funcs.server_exists(server=server):
         return False
 
-    support_info = get_all_supports(threads=threads, server=server)
+    support_info = get_all_supports(threads=threads,
+                                    asynchronous=asynchronous,
+                                    server=server)
 
     if not support_info:
         return False
@@ -212,26 +267,24 @@ def list_supports(claim_id=False, invalid=False,
     n_supports = len(all_supports)
 
     out = []
+    field_sep = f"{sep} "
+
+    # Spent supports, and valid claims when only invalid claims
+    # are requested, are dropped in one pass before the main loop
+    kept = [(num, support)
+            for num, support in enumerate(all_supports, start=1)
+            if not support["is_spent"]
+            and not (invalid and support["resolved"])]
 
-    for num, support in enumerate(all_supports, start=1):
+    for num, support in kept:
         resolved = support["resolved"]
 
         if resolved:
-            name = resolved["short_url"].split("lbry://")[1]
-            title = resolved["short_url"].split("lbry://")[1]
-
-            if "value" in resolved:
-                title = resolved["value"].get("title", "(no title)")
+            name = resolved["short_url"].partition("lbry://")[2]
         else:
             name = support["name"]
-            title = "[" + support["name"] + "]"
-
-        if sanitize:
-            name = funcs.sanitize_text(name)
-            title = funcs.sanitize_text(title)
 
-        cid = support["claim_id"]
-        is_channel = True if name.startswith("@") else False
+        is_channel = name.startswith("@")
 
         if is_channel and not channels:
             continue
@@ -239,24 +292,28 @@ def list_supports(claim_id=False, invalid=False,
         if not is_channel and not claims:
             continue
 
-        obj = ""
-        if claim_id:
-            obj += f'"{cid}"' + f"{sep} "
+        if resolved:
+            title = name
+
+            if "value" in resolved:
+                title = resolved["value"].get("title", "(no title)")
+        else:
+            title = "[" + name + "]"
+
+        if sanitize:
+            name = funcs.sanitize_text(name)
+            title = funcs.sanitize_text(title)
+
+        cid = support["claim_id"]
 
         _name = f'"{name}"'
 
         if not resolved:
             _name = "[" + _name + "]"
 
-        obj += f'{_name:60s}'
-
         _amount = float(support["amount"])
-        amount = f"{_amount:14.8f}"
 
         if resolved:
-            if invalid:
-                continue
-
             meta = resolved["meta"]
             base = float(resolved["amount"])
             supp = float(meta["support_amount"])
@@ -265,45 +322,43 @@ def list_supports(claim_id=False, invalid=False,
             # so it doesn't have base support; the only support may be from us
             meta = {}
             base = 0
-            supp = float(support["amount"])
+            supp = _amount
 
         existing_support = base + supp
 
-        trend_gl = meta.get("trending_global", 0)
-        trend_gr = meta.get("trending_group", 0)
-        trend_loc = meta.get("trending_local", 0)
-        trend_mix = meta.get("trending_mixed", 0)
-
-        combined = (trend_gl
-                    + trend_gr
-                    + trend_loc
-                    + trend_mix)
-
-        tr_gl = f'{trend_gl:7.2f}'
-        tr_gr = f'{trend_gr:7.2f}'
-        tr_loc = f'{trend_loc:7.2f}'
-        tr_mix = f'{trend_mix:7.2f}'
-        tr_combined = f'{combined:7.2f}'
-        is_spent = support["is_spent"]
-
-        line = f"{num:3d}/{n_supports:3d}" + f"{sep} "
-        line += f"{obj}" + f"{sep} " + f"{amount}" + f"{sep} "
-        line += f"{existing_support:15.8f}" + f"{sep} "
-
-        if not is_spent:
-            if combine:
-                line += f"combined: {tr_combined}" + f"{sep} "
-            else:
-                line += f"mix: {tr_mix}" + f"{sep} "
-                line += f"glob: {tr_gl}" + f"{sep} "
-                line += f"grp: {tr_gr}" + f"{sep} "
-                line += f"loc: {tr_loc}" + f"{sep} "
+        try:
+            trend_gl, trend_gr, trend_loc, trend_mix = TRENDS(meta)
+        except KeyError:
+            # Invalid claims, or hubs that don't report every score
+            trend_gl = meta.get("trending_global", 0)
+            trend_gr = meta.get("trending_group", 0)
+            trend_loc = meta.get("trending_local", 0)
+            trend_mix = meta.get("trending_mixed", 0)
+
+        fields = [f"{num:3d}/{n_supports:3d}"]
+
+        if claim_id:
+            fields.append(f'"{cid}"')
+
+        fields.extend([f"{_name:60s}",
+                       f"{_amount:14.8f}",
+                       f"{existing_support:15.8f}"])
+
+        if combine:
+            combined = (trend_gl
+                        + trend_gr
+                        + trend_loc
+                        + trend_mix)
+            fields.append(f"combined: {combined:7.2f}")
         else:
-            continue
+            fields.extend([f"mix: {trend_mix:7.2f}",
+                           f"glob: {trend_gl:7.2f}",
+                           f"grp: {trend_gr:7.2f}",
+                           f"loc: {trend_loc:7.2f}"])
 
-        line += f"{title}"
+        fields.append(title)
 
-        out.append(line)
+        out.append(field_sep.join(fields))
 
     funcs.print_content(out, file=file, fdate=fdate)
 
@@ -332,7 +387,10 @@ def get_base_support(uri=None, cid=None, name=None,
     if not funcs.server_exists(server=server):
         return False
 
+    # The amounts decide how much LBC is spent, so they are never
+    # taken from the search cache
     item = srch.search_item(uri=uri, cid=cid, name=name, offline=False,
+                            cache=False,
                             server=server)
 
     if not item:
@@ -347,21 +405,15 @@ def get_base_support(uri=None, cid=None, name=None,
     msg = {"method": "support_list",
            "params": {"claim_id": item["claim_id"]}}
 
-    output = requests.post(server, json=msg).json()
+    output = funcs.post_json(server, msg)
 
     if "error" in output:
         return False
 
     supported_items = output["result"]["items"]
-    old_support = 0
-
-    if not supported_items:
-        # Old support remains 0
-        pass
-    else:
-        # There may be many independent supports
-        for support in supported_items:
-            old_support += float(support["amount"])
+    # There may be many independent supports, or none
+    old_support = sum(float(support["amount"])
+                      for support in supported_items)
 
     base_support = existing - old_support
 
@@ -446,34 +498,17 @@ def create_support(uri=None, cid=None, name=None,
     base_support = supports["base_support"]
     old_support = supports["old_support"]
 
-    new_support = 0.0
-    t_input = 0.0
-    t_output = 0.0
-    t_fee = 0.0
-    txid = None
-
-    amount = abs(amount)
-    msg = {"method": "support_create",
-           "params": {"claim_id": claim_id,
-                      "amount": f"{amount:.8f}"}}
-
-    output = requests.post(server, json=msg).json()
+    created = add_support(claim_id, amount=amount, print_msg=False,
+                          server=server)
 
-    if "error" in output:
-        error = output["error"]
-        if "data" in error:
-            print(">>> Error: {}, {}".format(error["data"]["name"],
-                                             error["message"]))
-        else:
-            print(f">>> Error: {error}")
-        print(f">>> Requested amount: {amount:.8f}")
+    if not created:
         return False
 
-    new_support = amount
-    t_input = float(output["result"]["total_input"])
-    t_output = float(output["result"]["total_output"])
-    t_fee = float(output["result"]["total_fee"])
-    txid = output["result"]["txid"]
+    new_support = created["new_support"]
+    t_input = created["t_input"]
+    t_output = created["t_output"]
+    t_fee = created["t_fee"]
+    txid = created["txid"]
 
     out = [f"canonical_url: {uri}",
            f"claim_id: {claim_id}",
@@ -500,6 +535,92 @@ def create_support(uri=None, cid=None, name=None,
             "txid": txid}
 
 
+def add_support(cid, amount=0.0, print_msg=True,
+                server="http://localhost:5279"):
+    """Create a new support on a claim given by its claim ID.
+
+    Unlike `create_support`, the claim is not resolved first,
+    and its existing support is not looked up, so only one request
+    is sent to the server. This is useful to support many claims
+    whose claim IDs are already known.
+
+    Parameters
+    ----------
+    cid: str
+        A `'claim_id'` for a claim on the LBRY network.
+        It is a 40 character alphanumeric string.
+    amount: float, optional
+        It defaults to `0.0`.
+        It is the amount of LBC support that will be deposited,
+        whether there is a previous support or not.
+    print_msg: bool, optional
+        It defaults to `True`, in which case it will print the amount
+        applied and the transaction information.
+        If it is `False` nothing will be printed, except errors.
+    server: str, optional
+        It defaults to `'http://localhost:5279'`.
+        This is the address of the `lbrynet` daemon, which should be running
+        in your computer before using any `lbrynet` command.
+        Normally, there is no need to change this parameter from its default
+        value.
+
+    Returns
+    -------
+    dict
+        A dictionary with information on the result of the support.
+        The keys are the following:
+        - 'claim_id': unique 40 character alphanumeric string.
+        - 'new_support': new support that was successfully deposited
+          in the claim, equal to `amount`.
+        - 't_input', 't_output', 't_fee': total input, output, and fee
+          of the transaction.
+        - 'txid': transaction ID in the blockchain that records the operation.
+    False
+        If there is a problem or non existing claim, or lack of funds,
+        it will return `False`.
+    """
+    if not funcs.server_exists(server=server):
+        return False
+
+    amount = abs(amount)
+    msg = {"method": "support_create",
+           "params": {"claim_id": cid,
+                      "amount": f"{amount:.8f}"}}
+
+    output = funcs.post_json(server, msg)
+
+    if "error" in output:
+        error = output["error"]
+        if "data" in error:
+            print(">>> Error: {}, {}".format(error["data"]["name"],
+                                             error["message"]))
+        else:
+            print(f">>> Error: {error}")
+        print(f">>> Requested amount: {amount:.8f}")
+        return False
+
+    srch.clear_cache()
+
+    t_input, t_output, t_fee, txid = tx_totals(output["result"])
+
+    if print_msg:
+        out = [f"claim_id: {cid}",
+               f"Applied:          {amount:14.8f}",
+               f"total_input:      {t_input:14.8f}",
+               f"total_output:     {t_output:14.8f}",
+               f"total_fee:        {t_fee:14.8f}",
+               f"txid: {txid}"]
+
+        print("\n".join(out))
+
+    return {"claim_id": cid,
+            "new_support": amount,
+            "t_input": t_input,
+            "t_output": t_output,
+            "t_fee": t_fee,
+            "txid": txid}
+
+
 def calculate_abandon(claim_id=None, keep=0.0,
                       server="http://localhost:5279"):
     """Actually abandon the support and get the data."""
@@ -515,7 +636,7 @@ def calculate_abandon(claim_id=None, keep=0.0,
     if keep:
         msg["params"]["keep"] = f"{keep:.8f}"
 
-    output = requests.post(server, json=msg).json()
+    output = funcs.post_json(server, msg)
 
     if "error" in output:
         error = output["error"]
@@ -527,11 +648,10 @@ def calculate_abandon(claim_id=None, keep=0.0,
         print(f">>> Requested amount: {keep:.8f}")
         return False
 
+    srch.clear_cache()
+
     new_support = keep
-    t_input = float(output["result"]["total_input"])
-    t_output = float(output["result"]["total_output"])
-    t_fee = float(output["result"]["total_fee"])
-    txid = output["result"]["txid"]
+    t_input, t_output, t_fee, txid = tx_totals(output["result"])
 
     text = [f"Applied:          {new_support:14.8f}",
             f"total_input:      {t_input:14.8f}",
@@ -728,7 +848,6 @@ def abandon_support_inv(invalids=None, cid=None, name=None,
     existing = 0
     base_support = 0
     old_support = 0
-    found = False
 
     if not invalids:
         support_info = get_all_supports(threads=threads, server=server)
@@ -738,22 +857,34 @@ def abandon_support_inv(invalids=None, cid=None, name=None,
 
         invalids = support_info["invalid_supports"]
 
-    for support in invalids:
-        if ((cid and cid in support["claim_id"])
-                or (name and name in support["name"])):
-            existing = float(support["amount"])
-            old_support = float(support["amount"])
-            claim_id = support["claim_id"]
-            c_name = support["name"]
-            found = True
+    # A full claim ID or name is found directly; otherwise the last
+    # support whose claim ID or name contains the input is used
+    support = None
+
+    if cid:
+        support = {s["claim_id"]: s for s in invalids}.get(cid)
+
+    if not support and name:
+        support = {s["name"]: s for s in invalids}.get(name)
+
+    if not support:
+        support = next((s for s in reversed(invalids)
+                        if ((cid and cid in s["claim_id"])
+                            or (name and name in s["name"]))),
+                       None)
 
-    if not found:
+    if not support:
         print(80 * "-")
         print("Claim not found among the invalid claims")
         print(f'cid={cid}\n'
               f'name="{name}"')
         return False
 
+    existing = float(support["amount"])
+    old_support = float(support["amount"])
+    claim_id = support["claim_id"]
+    c_name = support["name"]
+
     calculation = calculate_abandon(claim_id=claim_id, keep=keep,
                                     server=server)
     if not calculation:
@@ -784,7 +915,7 @@ def abandon_support_inv(invalids=None, cid=None, name=None,
 
 
 def target_support(uri=None, cid=None, name=None,
-                   target=0.0,
+                   target=0.0, print_msg=True,
                    server="http://localhost:5279"):
     """Add an appropriate amount of LBC to reach a target support.
 
@@ -815,6 +946,11 @@ def target_support(uri=None, cid=None, name=None,
         For example, if the current support is `100`, and we specify a target
         of `500`, we will be supporting the claim with `400`
         in order to reach the target.
+    print_msg: bool, optional
+        It defaults to `True`, in which case it will print a summary
+        of the existing, target, and applied support.
+        If it is `False` nothing will be printed, except errors;
+        the same information is in the returned dictionary.
     server: str, optional
         It defaults to `'http://localhost:5279'`.
         This is the address of the `lbrynet` daemon, which should be running
@@ -861,6 +997,18 @@ def target_support(uri=None, cid=None, name=None,
     if not supports:
         return False
 
+    return apply_target(supports, target=target, print_msg=print_msg,
+                        server=server)
+
+
+def apply_target(supports, target=0.0, print_msg=True,
+                 server="http://localhost:5279"):
+    """Add or remove our support on a claim to reach a target support.
+
+    The `supports` dictionary is the output of `get_base_support`
+    for the claim, and the returned dictionary is the same
+    as in `target_support`.
+    """
     uri = supports["canonical_url"]
     claim_id = supports["claim_id"]
     c_name = supports["name"]
@@ -869,14 +1017,6 @@ def target_support(uri=None, cid=None, name=None,
     old_support = supports["old_support"]
 
     target = abs(target)
-    out = [f"canonical_url: {uri}",
-           f"claim_id: {claim_id}",
-           f"Existing support: {existing:14.8f}",
-           f"Base support:     {base_support:14.8f}",
-           f"Old support:      {old_support:14.8f}",
-           "",
-           f"Target:           {target:14.8f}"]
-
     new_support = 0.0
     must_add = 0.0
 
@@ -896,9 +1036,6 @@ def target_support(uri=None, cid=None, name=None,
         # Same target as base support, nothing to add, reset support to 0
         pass
 
-    out.append(f"Must add:         {must_add:14.8f}")
-    out.append(f"New support:      {new_support:14.8f}")
-
     applied = 0.0
     t_input = 0.0
     t_output = 0.0
@@ -917,13 +1054,13 @@ def target_support(uri=None, cid=None, name=None,
             msg = {"method": "support_create",
                    "params": {"claim_id": claim_id,
                               "amount": f"{new_support:.8f}"}}
-            output = requests.post(server, json=msg).json()
+            output = funcs.post_json(server, msg)
         else:
             # Existing support, so we update it with the new value
             msg = {"method": "support_abandon",
                    "params": {"claim_id": claim_id,
                               "keep": f"{new_support:.8f}"}}
-            output = requests.post(server, json=msg).json()
+            output = funcs.post_json(server, msg)
 
         if "error" in output:
             error = output["error"]
@@ -935,23 +1072,32 @@ def target_support(uri=None, cid=None, name=None,
             print(f">>> Requested amount: {new_support:.8f}")
             return False
 
-        applied = new_support
-        t_input = float(output["result"]["total_input"])
-        t_output = float(output["result"]["total_output"])
-        t_fee = float(output["result"]["total_fee"])
-        txid = output["result"]["txid"]
-
-    out += ["",
-            f"Applied:          {applied:14.8f}",
-            f"total_input:      {t_input:14.8f}",
-            f"total_output:     {t_output:14.8f}",
-            f"total_fee:        {t_fee:14.8f}",
-            f"txid: {txid}"]
+        srch.clear_cache()
 
-    print("\n".join(out))
+        applied = new_support
+        t_input, t_output, t_fee, txid = tx_totals(output["result"])
+
+    if print_msg:
+        out = [f"canonical_url: {uri}",
+               f"claim_id: {claim_id}",
+               f"Existing support: {existing:14.8f}",
+               f"Base support:     {base_support:14.8f}",
+               f"Old support:      {old_support:14.8f}",
+               "",
+               f"Target:           {target:14.8f}",
+               f"Must add:         {must_add:14.8f}",
+               f"New support:      {new_support:14.8f}",
+               "",
+               f"Applied:          {applied:14.8f}",
+               f"total_input:      {t_input:14.8f}",
+               f"total_output:     {t_output:14.8f}",
+               f"total_fee:        {t_fee:14.8f}",
+               f"txid: {txid}"]
+
+        print("\n".join(out))
 
     return {"canonical_url": uri,
-            "claim_id": cid,
+            "claim_id": claim_id,
             "name": c_name,
             "existing_support": existing,
             "base_support": base_support,
@@ -960,3 +1106,103 @@ def target_support(uri=None, cid=None, name=None,
             "must_add": must_add,
             "new_support": new_support,
             "txid": txid}
+
+
+def get_base_support_th(claim, server):
+    """Wrapper to use with threads in `target_supports`."""
+    return get_base_support(uri=claim.get("uri"),
+                            cid=claim.get("cid"),
+                            name=claim.get("name"),
+                            server=server)
+
+
+def target_supports(claims, threads=32, print_msg=True,
+                    server="http://localhost:5279"):
+    """Reach a target support in many claims.
+
+    Parameters
+    ----------
+    claims: list of dict
+        Each element is a dictionary with the claim to support,
+        given by its `'uri'`, `'cid'`, or `'name'` keys, as in
+        `target_support`, and the `'target'` support for that claim.
+        If the same claim is given more than once, only its last
+        `'target'` is applied.
+        ::
+            claims = [{"uri": "@MyChannel#3/some-video-name#2",
+                       "target": 500},
+                      {"name": "some-other-video", "target": 20}]
+    threads: int, optional
+        It defaults to 32.
+        It is the number of threads that will be used to look up
+        the existing support of the claims in parallel.
+        The transactions are then made one by one, in the order
+        of `claims`, so the printed summaries are in the same order.
+        If it is 0, the claims will be looked up one by one as well.
+    print_msg: bool, optional
+        It defaults to `True`, in which case it will print the summary
+        of `target_support` for each claim.
+        If it is `False` nothing will be printed, except errors.
+    server: str, optional
+        It defaults to `'http://localhost:5279'`.
+        This is the address of the `lbrynet` daemon, which should be running
+        in your computer before using any `lbrynet` command.
+        Normally, there is no need to change this parameter from its default
+        value.
+
+    Returns
+    -------
+    list
+        A list with the output of `target_support` for each claim,
+        in the same order as `claims`; it is `False` for the claims
+        that could not be found or supported.
+        A claim given more than once has the same output in every place.
+    False
+        If there is a problem with the server it will return `False`.
+    """
+    if not funcs.server_exists(server=server):
+        return False
+
+    if not claims:
+        return []
+
+    threads = min(threads, len(claims))
+
+    if threads:
+        lookup = functools.partial(get_base_support_th, server=server)
+        lookups = [False] * len(claims)
+
+        for num, supports in funcs.run_limited(lookup, claims, threads):
+            lookups[num] = supports
+    else:
+        lookups = [get_base_support_th(claim, server) for claim in claims]
+
+    # All supports were looked up before any transaction, so a claim
+    # given twice is only applied once, with its last target;
+    # otherwise the second one would be computed from a stale support
+    last = {supports["claim_id"]: num
+            for num, supports in enumerate(lookups) if supports}
+
+    # The transactions spend from the same wallet, so they are made
+    # one at a time
+    applied = {}
+
+    for num, (claim, supports) in enumerate(zip(claims, lookups)):
+        if not supports:
+            continue
+
+        claim_id = supports["claim_id"]
+
+        if last[claim_id] != num:
+            continue
+
+        if print_msg:
+            print(80 * "-")
+
+        applied[claim_id] = apply_target(supports,
+                                         target=claim.get("target", 0.0),
+                                         print_msg=print_msg,
+                                         server=server)
+
+    return [applied[supports["claim_id"]] if supports else False
+            for supports in lookups]